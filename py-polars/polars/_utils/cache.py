@@ -67,12 +67,12 @@ class LRUCache(MutableMapping[K, V]):
 
     def __getitem__(self, key: K) -> V:
         """Raises KeyError if the key is not found."""
-        if key not in self._items:
+        try:
+            # moving accessed items to the end marks them as recently used
+            self._items.move_to_end(key)
+        except KeyError:
             msg = f"{key!r} not found in cache"
-            raise KeyError(msg)
-
-        # moving accessed items to the end marks them as recently used
-        self._items.move_to_end(key)
+            raise KeyError(msg) from None
         return self._items[key]
 
     def __iter__(self) -> Iterator[K]:
@@ -87,11 +87,12 @@ class LRUCache(MutableMapping[K, V]):
         """Insert a value into the cache."""
         if self._max_size == 0:
             return
-        while len(self) >= self._max_size:
-            self.popitem()
-        if key in self:
+        if key in self._items:
             # moving accessed items to the end marks them as recently used
             self._items.move_to_end(key)
+        else:
+            while len(self._items) >= self._max_size:
+                self._items.popitem(last=False)
         self._items[key] = value
 
     def __repr__(self) -> str:
@@ -119,11 +120,12 @@ class LRUCache(MutableMapping[K, V]):
 
     def get(self, key: K, default: D | V | None = None) -> V | D | None:
         """Return value associated with `key` if present, otherwise return `default`."""
-        if key in self:
+        try:
             # moving accessed items to the end marks them as recently used
             self._items.move_to_end(key)
-            return self._items[key]
-        return default
+        except KeyError:
+            return default
+        return self._items[key]
 
     @classmethod
     def fromkeys(cls, maxsize: int, *, keys: Iterable[K], value: V) -> Self:
@@ -151,8 +153,8 @@ class LRUCache(MutableMapping[K, V]):
         if n < 0:
             msg = f"`maxsize` cannot be negative; found {n}"
             raise ValueError(msg)
-        while len(self) > n:
-            self.popitem()
+        while len(self._items) > n:
+            self._items.popitem(last=False)
         self._max_size = n
 
     def pop(self, key: K, default: D | NoDefault = no_default) -> V | D:
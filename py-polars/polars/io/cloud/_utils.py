@@ -16,6 +16,8 @@ class NoPickleOption(Generic[T]):
     This wrapper will unpickle to contain a None. Used for cached values.
     """
 
+    __slots__ = ("_opt_value",)
+
     def __init__(self, opt_value: T | None = None) -> None:
         self._opt_value = opt_value
 
@@ -25,12 +27,9 @@ class NoPickleOption(Generic[T]):
     def set(self, value: T | None) -> None:
         self._opt_value = value
 
-    def __getstate__(self) -> tuple[()]:
-        # Needs to return not-None for `__setstate__()` to be called
-        return ()
-
-    def __setstate__(self, _state: tuple[()]) -> None:
-        NoPickleOption.__init__(self)
+    def __reduce__(self) -> tuple[type[NoPickleOption[Any]], tuple[()]]:
+        # Unpickles as a fresh, empty instance
+        return NoPickleOption, ()
 
 
 def _first_scan_path(
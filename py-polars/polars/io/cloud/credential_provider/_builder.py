@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import abc
+import contextlib
 import os
 import threading
+import weakref
 from typing import TYPE_CHECKING, Any, Callable, Literal, Union
 
 import polars._utils.logging
 from polars._utils.cache import LRUCache
 from polars._utils.logging import eprint, verbose
 from polars._utils.unstable import issue_unstable_warning
-from polars.io.cloud._utils import NoPickleOption
 from polars.io.cloud.credential_provider._providers import (
     CachingCredentialProvider,
     CredentialProvider,
@@ -22,6 +23,7 @@ from polars.io.cloud.credential_provider._providers import (
 
 if TYPE_CHECKING:
     import sys
+    from collections.abc import Hashable
 
     if sys.version_info >= (3, 10):
         from typing import TypeAlias
@@ -152,6 +154,8 @@ class CredentialProviderBuilder:
 
 
 class CredentialProviderBuilderImpl(abc.ABC):
+    __slots__ = ()
+
     @abc.abstractmethod
     def __call__(self) -> CredentialProviderFunction | None:
         pass
@@ -184,12 +188,17 @@ class InitializedCredentialProvider(CredentialProviderBuilderImpl):
         return repr(self.credential_provider)
 
 
-AUTO_INIT_LRU_CACHE: LRUCache[bytes, CredentialProviderBuilderReturn] | None = None
+AUTO_INIT_LRU_CACHE: LRUCache[AutoInit, CredentialProviderBuilderReturn] | None = None
 AUTO_INIT_LRU_CACHE_LOCK: threading.RLock = threading.RLock()
+# Providers evicted from the LRU cache that are still referenced elsewhere (e.g.
+# by a running query) can be recovered from here instead of being rebuilt.
+AUTO_INIT_WEAK_CACHE: weakref.WeakValueDictionary[AutoInit, Any] = (
+    weakref.WeakValueDictionary()
+)
 
 
 def _auto_init_with_cache(
-    get_cache_key_func: Callable[[], bytes],
+    cache_key: AutoInit,
     build_provider_func: Callable[[], CredentialProviderBuilderReturn],
 ) -> CredentialProviderBuilderReturn:
     global AUTO_INIT_LRU_CACHE
@@ -204,6 +213,7 @@ def _auto_init_with_cache(
     ) <= 0:
         if AUTO_INIT_LRU_CACHE_LOCK.acquire(blocking=False):
             AUTO_INIT_LRU_CACHE = None
+            AUTO_INIT_WEAK_CACHE.clear()
             AUTO_INIT_LRU_CACHE_LOCK.release()
 
         return build_provider_func()
@@ -219,12 +229,18 @@ def _auto_init_with_cache(
 
             AUTO_INIT_LRU_CACHE = LRUCache(max_items)
 
-        cache_key = get_cache_key_func()
-
         try:
             provider = AUTO_INIT_LRU_CACHE[cache_key]
         except KeyError:
-            provider = build_provider_func()
+            provider = AUTO_INIT_WEAK_CACHE.get(cache_key)
+
+            if provider is None:
+                provider = build_provider_func()
+
+                if provider is not None:
+                    with contextlib.suppress(TypeError):  # not weak-referenceable
+                        AUTO_INIT_WEAK_CACHE[cache_key] = provider
+
             AUTO_INIT_LRU_CACHE[cache_key] = provider
 
         return provider
@@ -233,48 +249,75 @@ def _auto_init_with_cache(
 # Represents an automatic initialization configuration. This is created for
 # credential_provider="auto".
 class AutoInit(CredentialProviderBuilderImpl):
+    __slots__ = ("_cache_key", "cls", "kw")
+
     def __init__(self, cls: Any, **kw: Any) -> None:
         self.cls = cls
         self.kw = kw
-        self._cache_key: NoPickleOption[bytes] = NoPickleOption()
+        self._cache_key: Hashable | None = None
 
     def __call__(self) -> CredentialProviderFunction | None:
         # This is used for credential_provider="auto", which allows for
         # ImportErrors.
         try:
-            return _auto_init_with_cache(
-                self.get_or_init_cache_key,
-                lambda: self.cls(**self.kw),
-            )
+            return _auto_init_with_cache(self, lambda: self.cls(**self.kw))
         except ImportError as e:
             if verbose():
                 eprint(f"failed to auto-initialize {self.provider_repr}: {e!r}")
 
         return None
 
-    def get_or_init_cache_key(self) -> bytes:
-        cache_key = self._cache_key.get()
+    def get_or_init_cache_key(self) -> Hashable:
+        cache_key = self._cache_key
 
         if cache_key is None:
-            cache_key = self.get_cache_key_impl()
-            self._cache_key.set(cache_key)
+            cache_key = self._cache_key = self.get_cache_key_impl()
 
             if verbose():
-                eprint(f"{self!r}: AutoInit cache key: {cache_key.hex()}")
+                eprint(f"{self!r}: AutoInit cache key: {cache_key!r}")
 
         return cache_key
 
-    def get_cache_key_impl(self) -> bytes:
-        import hashlib
-        import pickle
+    def get_cache_key_impl(self) -> Hashable:
+        try:
+            cache_key = (self.cls, frozenset(self.kw.items()))
+            hash(cache_key)
+        except TypeError:
+            # Unhashable kwargs, fall back to a digest of the pickled config.
+            import hashlib
+            import pickle
 
-        hash = hashlib.sha256(pickle.dumps(self))
-        return hash.digest()[:16]
+            return hashlib.sha256(pickle.dumps(self)).digest()[:16]
+
+        return cache_key
 
     @property
     def provider_repr(self) -> str:
         return self.cls.__name__
 
+    # Instances with the same configuration compare equal, so that they can be
+    # used directly as keys in the builder cache.
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
+        if not isinstance(other, AutoInit):
+            return NotImplemented
+
+        return self.get_or_init_cache_key() == other.get_or_init_cache_key()
+
+    def __hash__(self) -> int:
+        return hash(self.get_or_init_cache_key())
+
+    # Serialize only the provider class reference and its kwargs. The cache key
+    # is not serialized, it is re-generated on first use.
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _rebuild_auto_init, (self.cls, self.kw)
+
+
+def _rebuild_auto_init(cls: Any, kw: dict[str, Any]) -> AutoInit:
+    return AutoInit(cls, **kw)
+
 
 def _init_credential_provider_builder(
     credential_provider: CredentialProviderFunction
@@ -285,6 +328,10 @@ def _init_credential_provider_builder(
     storage_options: dict[str, Any] | None,
     caller_name: str,
 ) -> CredentialProviderBuilder | None:
+    # Fast path: credential providers are explicitly disabled.
+    if credential_provider is None:
+        return None
+
     def f() -> CredentialProviderBuilder | None:
         # Note: The behavior of this function should depend only on the function
         # parameters. Any environment-specific behavior should take place inside
@@ -298,9 +345,6 @@ def _init_credential_provider_builder(
             _is_gcp_cloud,
         )
 
-        if credential_provider is None:
-            return None
-
         if isinstance(credential_provider, CredentialProviderBuilder):
             # This happens when the catalog client auto-inits and passes it to
             # scan/write_delta, which calls us again.
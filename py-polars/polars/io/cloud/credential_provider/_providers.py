@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import abc
+import hashlib
 import importlib.util
 import json
 import os
 import subprocess
 import sys
+import threading
 import zoneinfo
 from datetime import datetime
 from functools import partial
@@ -19,7 +21,9 @@ from typing import (
 )
 
 import polars._utils.logging
+from polars._utils.cache import LRUCache
 from polars._utils.logging import eprint, verbose
+from polars._utils.various import no_default
 from polars.io.cloud._utils import NoPickleOption
 
 if TYPE_CHECKING:
@@ -93,22 +97,25 @@ class CachingCredentialProvider(CredentialProvider, abc.ABC):
             )
 
     def __call__(self) -> CredentialProviderFunctionReturn:
+        cached_credentials = self._cached_credentials
+
+        # Note: Read on every call, this can be toggled at runtime.
         if os.getenv("POLARS_DISABLE_PYTHON_CREDENTIAL_CACHING") == "1":
-            self._cached_credentials.set(None)
+            cached_credentials.set(None)
 
             return self.retrieve_credentials_impl()
 
-        credentials = self._cached_credentials.get()
+        credentials = cached_credentials.get()
 
         if credentials is None or (
             (expiry := credentials[1]) is not None
             and expiry <= int(datetime.now().timestamp())
         ):
             credentials = self.retrieve_credentials_impl()
-            self._cached_credentials.set(credentials)
+            cached_credentials.set(credentials)
             self._has_logged_use_cache = False
 
-        elif verbose() and not self._has_logged_use_cache:
+        elif not self._has_logged_use_cache and verbose():
             expiry = credentials[1]
             eprint(
                 f"[{type(self).__name__} @ {hex(id(self))}]: Using cached credentials ({expiry = })"
@@ -243,12 +250,35 @@ class CredentialProviderAWS(CachingCredentialProvider):
         if self._storage_options_has_endpoint_url:
             return {}
 
-        try:
-            config = self._session()._session.get_scoped_config()
-        except ImportError:
-            return {}
+        # Building a boto3 session to read the scoped config is expensive, so
+        # the loaded endpoint_url is cached. The key holds digests of the file
+        # contents rather than e.g. mtimes, so that edits are always picked up
+        # without keeping secrets from the credentials file in memory. Both
+        # profile environment variables are part of the key as-is, so that we
+        # don't have to replicate botocore's profile resolution order.
+        cache_key = (
+            self.profile_name,
+            os.getenv("AWS_PROFILE"),
+            os.getenv("AWS_DEFAULT_PROFILE"),
+            _aws_file_digest("AWS_CONFIG_FILE", "~/.aws/config"),
+            _aws_file_digest("AWS_SHARED_CREDENTIALS_FILE", "~/.aws/credentials"),
+        )
+
+        with _AWS_ENDPOINT_URL_CACHE_LOCK:
+            endpoint_url = _AWS_ENDPOINT_URL_CACHE.get(cache_key, no_default)
+
+        if endpoint_url is no_default:
+            try:
+                config = self._session()._session.get_scoped_config()
+            except ImportError:
+                return {}
+
+            endpoint_url = config.get("endpoint_url")
 
-        if endpoint_url := config.get("endpoint_url"):
+            with _AWS_ENDPOINT_URL_CACHE_LOCK:
+                _AWS_ENDPOINT_URL_CACHE[cache_key] = endpoint_url
+
+        if endpoint_url:
             if verbose():
                 eprint(f"[CredentialProviderAWS]: Loaded endpoint_url: {endpoint_url}")
 
@@ -312,6 +342,24 @@ class CredentialProviderAWS(CachingCredentialProvider):
         """
 
 
+_AWS_ENDPOINT_URL_CACHE: LRUCache[
+    tuple[str | None, str | None, str | None, bytes | None, bytes | None],
+    str | None,
+] = LRUCache(8)
+_AWS_ENDPOINT_URL_CACHE_LOCK: threading.Lock = threading.Lock()
+
+
+def _aws_file_digest(env_var: str, default_path: str) -> bytes | None:
+    """SHA-256 digest of an AWS config/credentials file, or None if unreadable."""
+    path = os.path.expanduser(os.getenv(env_var, default_path))
+
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).digest()
+    except OSError:
+        return None
+
+
 class CredentialProviderAzure(CachingCredentialProvider):
     """
     Azure Credential Provider.
@@ -95,7 +95,7 @@ def fruits_cars() -> pl.DataFrame:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def str_ints_df() -> pl.DataFrame:
     n = 1000
 
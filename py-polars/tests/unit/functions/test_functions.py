@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from datetime import date
+from typing import TYPE_CHECKING, Any, Callable
 
 import numpy as np
 import pytest
@@ -18,20 +19,15 @@ def test_concat_align() -> None:
     b = pl.DataFrame({"a": ["a", "b", "c"], "c": [5.5, 6.0, 7.5]})
     c = pl.DataFrame({"a": ["a", "b", "c", "d", "e"], "d": ["w", "x", "y", "z", None]})
 
-    for align_full in ("align", "align_full"):
-        result = pl.concat([a, b, c], how=align_full)
-        expected = pl.DataFrame(
-            {
-                "a": ["a", "b", "c", "d", "e", "e"],
-                "b": [1, 2, None, 4, 5, 6],
-                "c": [5.5, 6.0, 7.5, None, None, None],
-                "d": ["w", "x", "y", "z", None, None],
-            }
-        )
-        assert_frame_equal(result, expected)
-
-    result = pl.concat([a, b, c], how="align_left")
-    expected = pl.DataFrame(
+    expected_full = pl.DataFrame(
+        {
+            "a": ["a", "b", "c", "d", "e", "e"],
+            "b": [1, 2, None, 4, 5, 6],
+            "c": [5.5, 6.0, 7.5, None, None, None],
+            "d": ["w", "x", "y", "z", None, None],
+        }
+    )
+    expected_left = pl.DataFrame(
         {
             "a": ["a", "b", "d", "e", "e"],
             "b": [1, 2, 4, 5, 6],
@@ -39,10 +35,7 @@ def test_concat_align() -> None:
             "d": ["w", "x", "z", None, None],
         }
     )
-    assert_frame_equal(result, expected)
-
-    result = pl.concat([a, b, c], how="align_right")
-    expected = pl.DataFrame(
+    expected_right = pl.DataFrame(
         {
             "a": ["a", "b", "c", "d", "e"],
             "b": [1, 2, None, None, None],
@@ -50,10 +43,7 @@ def test_concat_align() -> None:
             "d": ["w", "x", "y", "z", None],
         }
     )
-    assert_frame_equal(result, expected)
-
-    result = pl.concat([a, b, c], how="align_inner")
-    expected = pl.DataFrame(
+    expected_inner = pl.DataFrame(
         {
             "a": ["a", "b"],
             "b": [1, 2],
@@ -61,7 +51,20 @@ def test_concat_align() -> None:
             "d": ["w", "x"],
         }
     )
-    assert_frame_equal(result, expected)
+
+    # "align" is an alias of "align_full"
+    result_full = pl.concat([a, b, c], how="align")
+    assert_frame_equal(result_full, expected_full)
+    assert result_full.equals(pl.concat([a, b, c], how="align_full"))
+
+    result = pl.concat([a, b, c], how="align_left")
+    assert_frame_equal(result, expected_left)
+
+    result = pl.concat([a, b, c], how="align_right")
+    assert_frame_equal(result, expected_right)
+
+    result = pl.concat([a, b, c], how="align_inner")
+    assert_frame_equal(result, expected_inner)
 
 
 @pytest.mark.parametrize(
@@ -135,63 +138,58 @@ def test_concat_diagonal_relaxed_with_empty_frame() -> None:
     assert_frame_equal(out, expected)
 
 
+@pytest.mark.parametrize(
+    ("frames", "expected"),
+    [
+        # two frames
+        (
+            [
+                {"a": ["a", "b"], "b": [1, 2]},
+                {"c": [5, 7, 8, 9], "d": [1, 2, 1, 2], "e": [1, 2, 1, 2]},
+            ],
+            {
+                "a": ["a", "b", None, None],
+                "b": [1, 2, None, None],
+                "c": [5, 7, 8, 9],
+                "d": [1, 2, 1, 2],
+                "e": [1, 2, 1, 2],
+            },
+        ),
+        # three frames
+        (
+            [
+                {"a1": [1, 2, 3], "a2": ["a", "b", "c"]},
+                {"b1": [0.25, 0.5]},
+                {"c1": [1, 2, 3, 4], "c2": [5, 6, 7, 8], "c3": [9, 10, 11, 12]},
+            ],
+            {
+                "a1": [1, 2, 3, None],
+                "a2": ["a", "b", "c", None],
+                "b1": [0.25, 0.5, None, None],
+                "c1": [1, 2, 3, 4],
+                "c2": [5, 6, 7, 8],
+                "c3": [9, 10, 11, 12],
+            },
+        ),
+        # single frame
+        (
+            [{"a": ["a", "b"], "b": [1, 2]}],
+            {"a": ["a", "b"], "b": [1, 2]},
+        ),
+    ],
+)
 @pytest.mark.parametrize("lazy", [False, True])
-def test_concat_horizontal(lazy: bool) -> None:
-    a = pl.DataFrame({"a": ["a", "b"], "b": [1, 2]})
-    b = pl.DataFrame({"c": [5, 7, 8, 9], "d": [1, 2, 1, 2], "e": [1, 2, 1, 2]})
-
-    if lazy:
-        out = pl.concat([a.lazy(), b.lazy()], how="horizontal").collect()
-    else:
-        out = pl.concat([a, b], how="horizontal")
-
-    expected = pl.DataFrame(
-        {
-            "a": ["a", "b", None, None],
-            "b": [1, 2, None, None],
-            "c": [5, 7, 8, 9],
-            "d": [1, 2, 1, 2],
-            "e": [1, 2, 1, 2],
-        }
-    )
-    assert_frame_equal(out, expected)
-
-
-@pytest.mark.parametrize("lazy", [False, True])
-def test_concat_horizontal_three_dfs(lazy: bool) -> None:
-    a = pl.DataFrame({"a1": [1, 2, 3], "a2": ["a", "b", "c"]})
-    b = pl.DataFrame({"b1": [0.25, 0.5]})
-    c = pl.DataFrame({"c1": [1, 2, 3, 4], "c2": [5, 6, 7, 8], "c3": [9, 10, 11, 12]})
-
-    if lazy:
-        out = pl.concat([a.lazy(), b.lazy(), c.lazy()], how="horizontal").collect()
-    else:
-        out = pl.concat([a, b, c], how="horizontal")
-
-    expected = pl.DataFrame(
-        {
-            "a1": [1, 2, 3, None],
-            "a2": ["a", "b", "c", None],
-            "b1": [0.25, 0.5, None, None],
-            "c1": [1, 2, 3, 4],
-            "c2": [5, 6, 7, 8],
-            "c3": [9, 10, 11, 12],
-        }
-    )
-    assert_frame_equal(out, expected)
-
-
-@pytest.mark.parametrize("lazy", [False, True])
-def test_concat_horizontal_single_df(lazy: bool) -> None:
-    a = pl.DataFrame({"a": ["a", "b"], "b": [1, 2]})
+def test_concat_horizontal(
+    frames: list[dict[str, list[Any]]], expected: dict[str, list[Any]], lazy: bool
+) -> None:
+    dfs = [pl.DataFrame(data) for data in frames]
 
     if lazy:
-        out = pl.concat([a.lazy()], how="horizontal").collect()
+        out = pl.concat([df.lazy() for df in dfs], how="horizontal").collect()
     else:
-        out = pl.concat([a], how="horizontal")
+        out = pl.concat(dfs, how="horizontal")
 
-    expected = a
-    assert_frame_equal(out, expected)
+    assert_frame_equal(out, pl.DataFrame(expected))
 
 
 def test_concat_horizontal_duplicate_col() -> None:
@@ -216,55 +214,37 @@ def test_concat_vertical() -> None:
     assert_frame_equal(result, expected)
 
 
-def test_cov() -> None:
+@pytest.mark.parametrize(
+    ("func", "kwargs", "expected"),
+    [
+        (pl.cov, {}, -645.8333333333),
+        (pl.cov, {"ddof": 2}, -1291.6666666666),
+        (pl.corr, {}, -0.412199756),
+        (pl.corr, {"method": "spearman"}, -0.5),
+    ],
+)
+def test_cov_corr(
+    func: Callable[..., Any],
+    kwargs: dict[str, Any],
+    expected: float,
+) -> None:
     s1 = pl.Series("a", [10, 37, -40])
     s2 = pl.Series("b", [70, -10, 35])
-
-    # lazy/expression
     lf = pl.LazyFrame([s1, s2])
-    res1 = lf.select(
-        x=pl.cov("a", "b"),
-        y=pl.cov("a", "b", ddof=2),
-    ).collect()
-
-    # eager/series
-    res2 = (
-        pl.cov(s1, s2, eager=True).alias("x"),
-        pl.cov(s1, s2, eager=True, ddof=2).alias("y"),
-    )
-
-    # expect same result from both approaches
-    for idx, (r1, r2) in enumerate(zip(res1, res2)):
-        expected_value = -645.8333333333 if idx == 0 else -1291.6666666666
-        assert pytest.approx(expected_value) == r1.item()
-        assert_series_equal(r1, r2)
-
-
-def test_corr() -> None:
-    s1 = pl.Series("a", [10, 37, -40])
-    s2 = pl.Series("b", [70, -10, 35])
 
     # lazy/expression
-    lf = pl.LazyFrame([s1, s2])
-    res1 = lf.select(
-        x=pl.corr("a", "b"),
-        y=pl.corr("a", "b", method="spearman"),
-    ).collect()
+    res1 = lf.select(func("a", "b", **kwargs).alias("x")).collect().to_series()
 
     # eager/series
-    res2 = (
-        pl.corr(s1, s2, eager=True).alias("x"),
-        pl.corr(s1, s2, method="spearman", eager=True).alias("y"),
-    )
+    res2 = func(s1, s2, eager=True, **kwargs).alias("x")
 
     # expect same result from both approaches
-    for idx, (r1, r2) in enumerate(zip(res1, res2)):
-        assert pytest.approx(-0.412199756 if idx == 0 else -0.5) == r1.item()
-        assert_series_equal(r1, r2)
+    assert pytest.approx(expected) == res1.item()
+    assert_series_equal(res1, res2)
 
 
 def test_extend_ints() -> None:
-    a = pl.DataFrame({"a": [1 for _ in range(1)]}, schema={"a": pl.Int64})
+    a = pl.Series("a", [1], dtype=pl.Int64).to_frame()
     with pytest.raises(pl.exceptions.SchemaError):
         a.extend(a.select(pl.lit(0, dtype=pl.Int32).alias("a")))
 
@@ -293,7 +273,57 @@ def test_null_handling_correlation() -> None:
 
 
 def test_align_frames() -> None:
-    import numpy as np
+    # setup some test frames
+    df1 = pl.DataFrame(
+        {
+            "date": pl.date_range(date(2019, 1, 2), date(2019, 1, 10), eager=True),
+            "a": [0.0, 1.0, 2.0, None, 4.0, 5.0, 6.0, 7.0, 8.0],
+            "b": np.arange(9, 18, dtype=np.float64),
+        }
+    )
+    df2 = pl.DataFrame(
+        {
+            "date": pl.date_range(date(2019, 1, 4), date(2019, 1, 10), eager=True),
+            "a": np.arange(9, 16, dtype=np.float64),
+            "b": np.arange(10, 17, dtype=np.float64),
+        }
+    )
+
+    # use "align_frames" to calculate dot-product from disjoint rows
+    pf1, pf2 = pl.align_frames(df1, df2, on="date")
+    pl_dot = (
+        (pf1[["a", "b"]] * pf2[["a", "b"]])
+        .fill_null(0)
+        .select(pl.sum_horizontal("*").alias("dot"))
+        .insert_column(0, pf1["date"])
+    )
+    expected = pl.DataFrame(
+        {
+            "date": df1["date"],
+            "dot": [0.0, 0.0, 128.0, 132.0, 200.0, 242.0, 288.0, 338.0, 392.0],
+        }
+    )
+    assert_frame_equal(pl_dot, expected)
+
+    # confirm alignment function works with lazy frames
+    lf1, lf2 = pl.align_frames(df1.lazy(), df2.lazy(), on="date")
+    assert isinstance(lf1, pl.LazyFrame)
+    assert_frame_equal(lf1.collect(), pf1)
+    assert_frame_equal(lf2.collect(), pf2)
+
+    # misc: no frames results in an empty list
+    assert pl.align_frames(on="date") == []
+
+    # expected error condition
+    with pytest.raises(TypeError):
+        pl.align_frames(  # type: ignore[type-var]
+            df1.lazy(),
+            df2,
+            on="date",
+        )
+
+
+def test_align_frames_pandas_parity() -> None:
     import pandas as pd
 
     # setup some test frames
@@ -316,14 +346,13 @@ def test_align_frames() -> None:
     # calculate dot-product in pandas
     pd_dot = (pdf1 * pdf2).sum(axis="columns").to_frame("dot").reset_index()
 
-    # use "align_frames" to calculate dot-product from disjoint rows. pandas uses an
-    # index to automatically infer the correct frame-alignment for the calculation;
-    # we need to do it explicitly (which also makes it clearer what is happening)
-    pf1, pf2 = pl.align_frames(
-        pl.from_pandas(pdf1.reset_index()),
-        pl.from_pandas(pdf2.reset_index()),
-        on="date",
-    )
+    pl_pdf1 = pl.from_pandas(pdf1.reset_index())
+    pl_pdf2 = pl.from_pandas(pdf2.reset_index())
+
+    # pandas uses an index to automatically infer the correct frame-alignment for
+    # the calculation; we need to do it explicitly (which also makes it clearer
+    # what is happening)
+    pf1, pf2 = pl.align_frames(pl_pdf1, pl_pdf2, on="date")
     pl_dot = (
         (pf1[["a", "b"]] * pf2[["a", "b"]])
         .fill_null(0)
@@ -334,27 +363,6 @@ def test_align_frames() -> None:
     assert_frame_equal(pl_dot, pl.from_pandas(pd_dot))
     pd.testing.assert_frame_equal(pd_dot, pl_dot.to_pandas())
 
-    # confirm alignment function works with lazy frames
-    lf1, lf2 = pl.align_frames(
-        pl.from_pandas(pdf1.reset_index()).lazy(),
-        pl.from_pandas(pdf2.reset_index()).lazy(),
-        on="date",
-    )
-    assert isinstance(lf1, pl.LazyFrame)
-    assert_frame_equal(lf1.collect(), pf1)
-    assert_frame_equal(lf2.collect(), pf2)
-
-    # misc: no frames results in an empty list
-    assert pl.align_frames(on="date") == []
-
-    # expected error condition
-    with pytest.raises(TypeError):
-        pl.align_frames(  # type: ignore[type-var]
-            pl.from_pandas(pdf1.reset_index()).lazy(),
-            pl.from_pandas(pdf2.reset_index()),
-            on="date",
-        )
-
 
 def test_align_frames_misc() -> None:
     df1 = pl.DataFrame([[3, 5, 6], [5, 8, 9]], orient="row")
@@ -366,8 +374,22 @@ def test_align_frames_misc() -> None:
         on="column_0",
         descending=True,
     )
-    assert pf1.rows() == [(5, 8, 9), (4, None, None), (3, 5, 6), (2, None, None)]
-    assert pf2.rows() == [(5, None, None), (4, 2, 0), (3, 8, 9), (2, 5, 6)]
+    expected1 = pl.DataFrame(
+        {
+            "column_0": [5, 4, 3, 2],
+            "column_1": [8, None, 5, None],
+            "column_2": [9, None, 6, None],
+        }
+    )
+    expected2 = pl.DataFrame(
+        {
+            "column_0": [5, 4, 3, 2],
+            "column_1": [None, 2, 8, 5],
+            "column_2": [None, 0, 9, 6],
+        }
+    )
+    assert_frame_equal(pf1, expected1)
+    assert_frame_equal(pf2, expected2)
 
     # handle identical frames
     pf1, pf2, pf3 = pl.align_frames(
@@ -375,9 +397,9 @@ def test_align_frames_misc() -> None:
         on="column_0",
         descending=True,
     )
-    assert pf1.rows() == [(5, 8, 9), (4, None, None), (3, 5, 6), (2, None, None)]
+    assert_frame_equal(pf1, expected1)
     for pf in (pf2, pf3):
-        assert pf.rows() == [(5, None, None), (4, 2, 0), (3, 8, 9), (2, 5, 6)]
+        assert_frame_equal(pf, expected2)
 
 
 def test_align_frames_with_nulls() -> None:
@@ -386,10 +408,19 @@ def test_align_frames_with_nulls() -> None:
 
     a1, a2 = pl.align_frames(df1, df2, on="key")
 
-    aligned_frame_data = a1.to_dict(as_series=False), a2.to_dict(as_series=False)
-    assert aligned_frame_data == (
-        {"key": [None, "x", "y", "z"], "value": [0, 1, 2, None]},
-        {"key": [None, "x", "y", "z"], "value": [3, 4, 5, 6]},
+    assert_frame_equal(
+        a1,
+        pl.DataFrame(
+            {"key": [None, "x", "y", "z"], "value": [0, 1, 2, None]},
+            schema={"key": pl.String, "value": pl.Int64},
+        ),
+    )
+    assert_frame_equal(
+        a2,
+        pl.DataFrame(
+            {"key": [None, "x", "y", "z"], "value": [3, 4, 5, 6]},
+            schema={"key": pl.String, "value": pl.Int64},
+        ),
     )
 
 
@@ -414,22 +445,25 @@ def test_align_frames_duplicate_key() -> None:
     # │ b   ┆ null │  │ -1   ┆ 7.5  ┆ b   │
     # │ e   ┆ 5    │  │ null ┆ null ┆ e   │
     # └─────┴──────┘  └──────┴──────┴─────┘
-    assert af1.rows() == [
-        ("a", 1),
-        ("a", 2),
-        ("a", 4),
-        ("b", None),
-        ("b", None),
-        ("e", 5),
-    ]
-    assert af2.rows() == [
-        (0, 5.5, "a"),
-        (0, 5.5, "a"),
-        (0, 5.5, "a"),
-        (0, 6.0, "b"),
-        (-1, 7.5, "b"),
-        (None, None, "e"),
-    ]
+    assert_frame_equal(
+        af1,
+        pl.DataFrame(
+            {
+                "x": ["a", "a", "a", "b", "b", "e"],
+                "y": [1, 2, 4, None, None, 5],
+            }
+        ),
+    )
+    assert_frame_equal(
+        af2,
+        pl.DataFrame(
+            {
+                "y": [0, 0, 0, 0, -1, None],
+                "z": [5.5, 5.5, 5.5, 6.0, 7.5, None],
+                "x": ["a", "a", "a", "b", "b", "e"],
+            }
+        ),
+    )
 
     # align frames the other way round, using "left" alignment strategy
     af1, af2 = pl.align_frames(df2, df1, on="x", how="left")
@@ -446,20 +480,25 @@ def test_align_frames_duplicate_key() -> None:
     # │ 0   ┆ 6.0 ┆ b   │  │ b   ┆ null │
     # │ -1  ┆ 7.5 ┆ b   │  │ b   ┆ null │
     # └─────┴─────┴─────┘  └─────┴──────┘
-    assert af1.rows() == [
-        (0, 5.5, "a"),
-        (0, 5.5, "a"),
-        (0, 5.5, "a"),
-        (0, 6.0, "b"),
-        (-1, 7.5, "b"),
-    ]
-    assert af2.rows() == [
-        ("a", 1),
-        ("a", 2),
-        ("a", 4),
-        ("b", None),
-        ("b", None),
-    ]
+    assert_frame_equal(
+        af1,
+        pl.DataFrame(
+            {
+                "y": [0, 0, 0, 0, -1],
+                "z": [5.5, 5.5, 5.5, 6.0, 7.5],
+                "x": ["a", "a", "a", "b", "b"],
+            }
+        ),
+    )
+    assert_frame_equal(
+        af2,
+        pl.DataFrame(
+            {
+                "x": ["a", "a", "a", "b", "b"],
+                "y": [1, 2, 4, None, None],
+            }
+        ),
+    )
 
 
 def test_align_frames_single_row_20445() -> None:
@@ -525,17 +564,11 @@ def test_overflow_diff() -> None:
 @pytest.mark.may_fail_cloud  # reason: unknown type
 def test_fill_null_unknown_output_type() -> None:
     df = pl.DataFrame({"a": [None, 2, 3, 4, 5]})
-    assert df.with_columns(
-        np.exp(pl.col("a")).fill_null(pl.lit(1, pl.Float64))
-    ).to_dict(as_series=False) == {
-        "a": [
-            1.0,
-            7.38905609893065,
-            20.085536923187668,
-            54.598150033144236,
-            148.4131591025766,
-        ]
-    }
+    result = df.with_columns(np.exp(pl.col("a")).fill_null(pl.lit(1, pl.Float64)))
+
+    expected = np.exp(np.arange(1, 6, dtype=np.float64))
+    expected[0] = 1.0
+    assert_series_equal(result["a"], pl.Series("a", expected), check_exact=False)
 
 
 def test_approx_n_unique() -> None:
@@ -609,10 +642,13 @@ def test_lazy_functions() -> None:
     )
 
     # test function expressions against series
-    for name, value in expected.items():
+    row = out.row(0, named=True)
+    series_results: dict[str, Any] = {}
+    for name in expected:
         col, fn = name.split("_", 1)
         if series_fn := getattr(df[col], fn, None):
-            assert series_fn() == value[0]
+            series_results[name] = series_fn()
+    assert series_results == {name: row[name] for name in series_results}
 
     # regex selection
     out = df.select(
@@ -668,18 +704,16 @@ def test_escape_regex() -> None:
 
 
 @pytest.mark.parametrize("func", ["var", "std"])
-def test_var_std_lit_23156(func: str) -> None:
-    for n in range(100):
-        input = pl.DataFrame({"x": list(range(n))}).select(pl.col("x"), pl.lit(0))
-        out = getattr(input, func)()
-        if n <= 1:
-            assert_series_equal(
-                out["literal"], pl.Series("literal", [None], dtype=pl.Float64)
-            )
-        else:
-            assert_series_equal(
-                out["literal"], pl.Series("literal", [0.0], dtype=pl.Float64)
-            )
+@pytest.mark.parametrize("n", [0, 1, 2, 99])
+def test_var_std_lit_23156(func: str, n: int) -> None:
+    input = pl.DataFrame({"x": list(range(n))}).select(pl.col("x"), pl.lit(0))
+    out = getattr(input, func)()
+
+    # a literal has no spread, but needs two rows for a sample variance
+    expected = pl.DataFrame(
+        {"literal": [None if n <= 1 else 0.0]}, schema={"literal": pl.Float64}
+    )
+    assert_frame_equal(out.select("literal"), expected)
 
 
 def test_row_index_expr() -> None:
@@ -1,16 +1,23 @@
+import configparser
+import copy
+import gc
 import io
+import os
 import pickle
 import sys
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
-from unittest.mock import Mock
+from types import SimpleNamespace
+from typing import Any, Callable, TypeVar
 
 import pytest
 
 import polars as pl
 import polars.io.cloud.credential_provider
+from polars._utils.cache import LRUCache
 from polars.io.cloud._utils import NoPickleOption
+from polars.io.cloud.credential_provider import _builder, _providers
 from polars.io.cloud.credential_provider._builder import (
     AutoInit,
     _init_credential_provider_builder,
@@ -21,6 +28,29 @@ from polars.io.cloud.credential_provider._providers import (
     UserProvidedGCPToken,
 )
 
+T = TypeVar("T")
+
+_CFG_ENDPOINT_URL_333 = b"[default]\nendpoint_url = http://localhost:333\n"
+_CFG_ENDPOINT_URL_777 = b"[default]\nendpoint_url = http://localhost:777\n"
+_CREDS_DEFAULT = b"[default]\naws_access_key_id=Z\naws_secret_access_key=Z\n"
+
+
+def _pickle_roundtrip(obj: T) -> T:
+    result: T = pickle.loads(pickle.dumps(obj, protocol=5))
+    return result
+
+
+class _CallCounter:
+    """Wraps a callable and counts how many times it was called."""
+
+    def __init__(self, func: Callable[..., Any]) -> None:
+        self.func = func
+        self.call_count = 0
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.call_count += 1
+        return self.func(*args, **kwargs)
+
 
 @pytest.mark.parametrize(
     "io_func",
@@ -100,7 +130,7 @@ def test_credential_provider_serialization_auto_init(
     with pytest.raises(AssertionError, match="err_magic_1"):
         q.collect()
 
-    q = pickle.loads(pickle.dumps(q))
+    q = _pickle_roundtrip(q)
 
     def raises_2(*a: Any, **kw: Any) -> None:
         msg = "err_magic_2"
@@ -202,10 +232,7 @@ def test_credential_provider_aws_endpoint_url_scan_no_parameters(
     monkeypatch.setenv("AWS_CONFIG_FILE", str(cfg_file_path))
     monkeypatch.setenv("POLARS_VERBOSE", "1")
 
-    cfg_file_path.write_text("""\
-[default]
-endpoint_url = http://localhost:333
-""")
+    cfg_file_path.write_bytes(_CFG_ENDPOINT_URL_333)
 
     # Scan with no parameters should load via CredentialProviderAWS
     q = pl.scan_parquet("s3://.../...")
@@ -236,18 +263,12 @@ def test_credential_provider_aws_endpoint_url_serde(
     monkeypatch.setenv("AWS_CONFIG_FILE", str(cfg_file_path))
     monkeypatch.setenv("POLARS_VERBOSE", "1")
 
-    cfg_file_path.write_text("""\
-[default]
-endpoint_url = http://localhost:333
-""")
+    cfg_file_path.write_bytes(_CFG_ENDPOINT_URL_333)
 
     q = pl.scan_parquet("s3://.../...")
-    q = pickle.loads(pickle.dumps(q))
+    q = _pickle_roundtrip(q)
 
-    cfg_file_path.write_text("""\
-[default]
-endpoint_url = http://localhost:777
-""")
+    cfg_file_path.write_bytes(_CFG_ENDPOINT_URL_777)
 
     capfd.readouterr()
 
@@ -270,10 +291,7 @@ def test_credential_provider_aws_endpoint_url_with_storage_options(
     monkeypatch.setenv("AWS_CONFIG_FILE", str(cfg_file_path))
     monkeypatch.setenv("POLARS_VERBOSE", "1")
 
-    cfg_file_path.write_text("""\
-[default]
-endpoint_url = http://localhost:333
-""")
+    cfg_file_path.write_bytes(_CFG_ENDPOINT_URL_333)
 
     # Previously we would not initialize a credential provider at all if secrets
     # were given under `storage_options`. Now we always initialize so that we
@@ -324,10 +342,7 @@ def test_credential_provider_aws_endpoint_url_passed_in_storage_options(
     cfg_file_path = tmp_path / "config"
     monkeypatch.setenv("AWS_CONFIG_FILE", str(cfg_file_path))
 
-    cfg_file_path.write_text("""\
-[default]
-endpoint_url = http://localhost:333
-""")
+    cfg_file_path.write_bytes(_CFG_ENDPOINT_URL_333)
 
     q = pl.scan_parquet("s3://.../...")
 
@@ -344,14 +359,106 @@ endpoint_url = http://localhost:333
         q.collect()
 
 
+def _scoped_config_session() -> Any:
+    """Stand-in for a boto3 session that reads the default profile section."""
+    parser = configparser.ConfigParser()
+    parser.read(os.environ["AWS_CONFIG_FILE"])
+
+    section = os.getenv("AWS_PROFILE") or "default"
+    config = dict(parser[section]) if parser.has_section(section) else {}
+
+    return SimpleNamespace(_session=SimpleNamespace(get_scoped_config=lambda: config))
+
+
+@pytest.fixture
+def aws_endpoint_url_session(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> _CallCounter:
+    _set_default_credentials(tmp_path, monkeypatch)
+    monkeypatch.setenv("AWS_CONFIG_FILE", str(tmp_path / "config"))
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+    monkeypatch.delenv("AWS_DEFAULT_PROFILE", raising=False)
+
+    monkeypatch.setattr(_providers, "_AWS_ENDPOINT_URL_CACHE", LRUCache(8))
+
+    session = _CallCounter(_scoped_config_session)
+    monkeypatch.setattr(pl.CredentialProviderAWS, "_session", session)
+
+    return session
+
+
+@pytest.mark.write_disk
+def test_credential_provider_aws_endpoint_url_cache_hit(
+    tmp_path: Path, aws_endpoint_url_session: _CallCounter
+) -> None:
+    (tmp_path / "config").write_bytes(_CFG_ENDPOINT_URL_333)
+
+    for _ in range(3):
+        assert pl.CredentialProviderAWS()._storage_update_options() == {
+            "endpoint_url": "http://localhost:333"
+        }
+
+    assert aws_endpoint_url_session.call_count == 1
+
+    # The credentials file contents must not be held in the cache key
+    for key in _providers._AWS_ENDPOINT_URL_CACHE:
+        assert _CREDS_DEFAULT not in key
+
+
+@pytest.mark.write_disk
+def test_credential_provider_aws_endpoint_url_cache_config_rewrite(
+    tmp_path: Path, aws_endpoint_url_session: _CallCounter
+) -> None:
+    cfg_file_path = tmp_path / "config"
+    provider = pl.CredentialProviderAWS()
+
+    cfg_file_path.write_bytes(_CFG_ENDPOINT_URL_333)
+    assert provider._storage_update_options() == {
+        "endpoint_url": "http://localhost:333"
+    }
+
+    cfg_file_path.write_bytes(_CFG_ENDPOINT_URL_777)
+    assert provider._storage_update_options() == {
+        "endpoint_url": "http://localhost:777"
+    }
+
+    cfg_file_path.unlink()
+    assert provider._storage_update_options() == {}
+
+    assert aws_endpoint_url_session.call_count == 3
+
+
+@pytest.mark.write_disk
+def test_credential_provider_aws_endpoint_url_cache_profile_env(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    aws_endpoint_url_session: _CallCounter,
+) -> None:
+    (tmp_path / "config").write_bytes(
+        _CFG_ENDPOINT_URL_333 + b"[other]\nendpoint_url = http://localhost:777\n"
+    )
+    provider = pl.CredentialProviderAWS()
+
+    assert provider._storage_update_options() == {
+        "endpoint_url": "http://localhost:333"
+    }
+
+    monkeypatch.setenv("AWS_PROFILE", "other")
+    assert provider._storage_update_options() == {
+        "endpoint_url": "http://localhost:777"
+    }
+
+    # AWS_DEFAULT_PROFILE is part of the key even when AWS_PROFILE is set
+    monkeypatch.setenv("AWS_DEFAULT_PROFILE", "default")
+    provider._storage_update_options()
+
+    assert aws_endpoint_url_session.call_count == 3
+
+
 def _set_default_credentials(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     creds_file_path = tmp_path / "credentials"
 
-    creds_file_path.write_text("""\
-[default]
-aws_access_key_id=Z
-aws_secret_access_key=Z
-""")
+    creds_file_path.write_bytes(_CREDS_DEFAULT)
 
     monkeypatch.setenv("AWS_SHARED_CREDENTIALS_FILE", str(creds_file_path))
 
@@ -369,7 +476,7 @@ def test_credential_provider_python_builder_cache(
         }, None
 
     with monkeypatch.context() as cx:
-        provider_init = Mock(wraps=pl.CredentialProviderAWS.__init__)
+        provider_init = _CallCounter(pl.CredentialProviderAWS.__init__)
 
         cx.setattr(
             pl.CredentialProviderAWS,
@@ -457,7 +564,7 @@ def test_credential_provider_python_builder_cache(
         # Ensure cache key is memoized on generation
         assert capture.count("AutoInit cache key") == 1
 
-        pickle.loads(pickle.dumps(builder)).build_credential_provider()
+        _pickle_roundtrip(builder).build_credential_provider()
 
         capture = capfd.readouterr().err
 
@@ -469,8 +576,8 @@ def test_credential_provider_python_builder_cache(
 def test_credential_provider_python_credentials_cache(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    credentials_func = Mock(
-        wraps=lambda: (
+    credentials_func = _CallCounter(
+        lambda: (
             {
                 "aws_access_key_id": "...",
                 "aws_secret_access_key": "...",
@@ -512,7 +619,8 @@ def test_credential_provider_python_credentials_cache(
     assert credentials_func.call_count == 4
 
     assert provider._cached_credentials.get() is not None
-    assert pickle.loads(pickle.dumps(provider))._cached_credentials.get() is None
+    assert _pickle_roundtrip(provider)._cached_credentials.get() is None
+    assert copy.deepcopy(provider)._cached_credentials.get() is None
 
     assert provider() == (
         {
@@ -537,7 +645,7 @@ def test_no_pickle_option() -> None:
     v = NoPickleOption(3)
     assert v.get() == 3
 
-    out = pickle.loads(pickle.dumps(v))
+    out = _pickle_roundtrip(v)
 
     assert out.get() is None
 
@@ -635,6 +743,7 @@ credential_process = "{sys.executable}" -c "from pathlib import Path; print(Path
             {"bearer_token": "updated"},
         ),
     ],
+    ids=["aws", "azure", "gcp"],
 )
 def test_credential_provider_rebuild_clears_cache(
     credential_provider_class: type[CachingCredentialProvider],
@@ -715,7 +824,7 @@ def test_user_gcp_token_provider(
 
 
 def test_auto_init_cache_key_memoize(monkeypatch: pytest.MonkeyPatch) -> None:
-    get_cache_key_impl = Mock(wraps=AutoInit.get_cache_key_impl)
+    get_cache_key_impl = _CallCounter(AutoInit.get_cache_key_impl)
     monkeypatch.setattr(
         AutoInit,
         "get_cache_key_impl",
@@ -733,8 +842,82 @@ def test_auto_init_cache_key_memoize(monkeypatch: pytest.MonkeyPatch) -> None:
     assert get_cache_key_impl.call_count == 1
 
 
+def test_auto_init_weak_cache_recovers_evicted_provider(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class Provider:
+        def __init__(self, i: int) -> None:
+            self.i = i
+
+    monkeypatch.setenv("POLARS_CREDENTIAL_PROVIDER_BUILDER_CACHE_SIZE", "2")
+    monkeypatch.setattr(_builder, "AUTO_INIT_LRU_CACHE", None)
+    monkeypatch.setattr(_builder, "AUTO_INIT_WEAK_CACHE", weakref.WeakValueDictionary())
+
+    build = _CallCounter(Provider)
+
+    def get(i: int) -> Any:
+        return AutoInit(build, i=i)()
+
+    provider = get(0)
+    assert build.call_count == 1
+
+    # Fill the LRU cache past its size, evicting `provider`
+    get(1)
+    get(2)
+    assert build.call_count == 3
+    lru_cache = _builder.AUTO_INIT_LRU_CACHE
+    assert lru_cache is not None
+    assert AutoInit(build, i=0) not in lru_cache
+
+    # Still referenced here, so it is recovered rather than rebuilt
+    assert get(0) is provider
+    assert build.call_count == 3
+
+    # Evict it again and drop the last reference; it must now be rebuilt
+    get(3)
+    get(4)
+    assert build.call_count == 5
+
+    del provider
+    gc.collect()
+
+    assert get(0).i == 0
+    assert build.call_count == 6
+
+
+def test_auto_init_cache_size_zero_clears_weak_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class Provider:
+        def __init__(self, i: int) -> None:
+            self.i = i
+
+    monkeypatch.setenv("POLARS_CREDENTIAL_PROVIDER_BUILDER_CACHE_SIZE", "2")
+    monkeypatch.setattr(_builder, "AUTO_INIT_LRU_CACHE", None)
+    monkeypatch.setattr(_builder, "AUTO_INIT_WEAK_CACHE", weakref.WeakValueDictionary())
+
+    build = _CallCounter(Provider)
+
+    def get(i: int) -> Any:
+        return AutoInit(build, i=i)()
+
+    provider = get(0)
+    assert build.call_count == 1
+
+    # Disabling the cache must forget every provider, including ones that are
+    # still referenced elsewhere.
+    monkeypatch.setenv("POLARS_CREDENTIAL_PROVIDER_BUILDER_CACHE_SIZE", "0")
+    assert get(0) is not provider
+    assert build.call_count == 2
+    assert len(_builder.AUTO_INIT_WEAK_CACHE) == 0
+
+    monkeypatch.setenv("POLARS_CREDENTIAL_PROVIDER_BUILDER_CACHE_SIZE", "2")
+    assert get(0) is not provider
+    assert build.call_count == 3
+
+
 def test_cached_credential_provider_returns_copied_creds() -> None:
-    provider_func = Mock(wraps=lambda: ({"A": "A"}, None))
+    provider_func = _CallCounter(lambda: ({"A": "A"}, None))
     provider = CachedCredentialProvider(provider_func)
 
     assert provider_func.call_count == 0
@@ -1,37 +1,86 @@
 from __future__ import annotations
 
+import io
+import os
+import shutil
 import sys
 import urllib.parse
-import warnings
 from collections import OrderedDict
 from datetime import date, datetime
 from functools import partial
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
-import pyarrow.parquet as pq
 import pytest
 
 import polars as pl
 from polars.exceptions import ComputeError, SchemaFieldNotFoundError
 from polars.testing import assert_frame_equal, assert_series_equal
 
+if TYPE_CHECKING:
+    from polars._typing import EngineType
+
+
+@pytest.fixture(scope="session")
+def io_ipc_df(io_files_path: Path) -> pl.DataFrame:
+    return pl.read_ipc(io_files_path / "*.ipc")
+
+
+@pytest.fixture(scope="session")
+def partitioned_ipc_dataset(
+    io_ipc_df: pl.DataFrame, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Hive partitioned copy of the `*.ipc` test files, written once per session."""
+    root = tmp_path_factory.mktemp("hive_ds") / "partitioned_data"
+
+    # Keep the hive columns out of the files, so that they are only known
+    # through the directory names.
+    io_ipc_df.lazy().sink_parquet(
+        pl.PartitionByKey(root, by=["category", "fats_g"], include_key=False),
+        mkdir=True,
+    )
+
+    return root
+
+
+_HIVE_PREDS = [
+    pl.col("category") == "vegetables",
+    pl.col("category") != "vegetables",
+    pl.col("fats_g") > 0.5,
+    (pl.col("fats_g") == 0.5) & (pl.col("category") == "vegetables"),
+]
+
+
+@pytest.fixture(scope="session")
+def hive_pushdown_cases(
+    io_ipc_df: pl.DataFrame, partitioned_ipc_dataset: Path
+) -> list[tuple[pl.LazyFrame, pl.DataFrame]]:
+    """Pairs of (filtered hive scan, expected result) for each of `_HIVE_PREDS`."""
+    q = pl.scan_parquet(
+        partitioned_ipc_dataset / "**/*.parquet", hive_partitioning=True
+    )
+
+    # Partitioning changes the order
+    sort_by = ["fats_g", "category", "calories", "sugars_g"]
+
+    # The hive partitioned columns are appended,
+    # so we must ensure we assert in the proper order.
+    sorted_df = io_ipc_df.select(["calories", "sugars_g", "category", "fats_g"]).sort(
+        sort_by
+    )
+
+    # Filtering preserves the order, so the sort only has to happen once.
+    return [
+        (q.filter(pred).sort(sort_by), sorted_df.filter(pred)) for pred in _HIVE_PREDS
+    ]
+
 
 def impl_test_hive_partitioned_predicate_pushdown(
-    io_files_path: Path,
-    tmp_path: Path,
+    root: Path,
     monkeypatch: Any,
 ) -> None:
     monkeypatch.setenv("POLARS_VERBOSE", "1")
-    df = pl.read_ipc(io_files_path / "*.ipc")
-
-    root = tmp_path / "partitioned_data"
 
-    pq.write_to_dataset(
-        df.to_arrow(),
-        root_path=root,
-        partition_cols=["category", "fats_g"],
-    )
     q = pl.scan_parquet(root / "**/*.parquet", hive_partitioning=False)
     # checks schema
     assert q.collect_schema().names() == ["calories", "sugars_g"]
@@ -41,26 +90,6 @@ def impl_test_hive_partitioned_predicate_pushdown(
     q = pl.scan_parquet(root / "**/*.parquet", hive_partitioning=True)
     assert q.collect_schema().names() == ["calories", "sugars_g", "category", "fats_g"]
 
-    # Partitioning changes the order
-    sort_by = ["fats_g", "category", "calories", "sugars_g"]
-
-    # The hive partitioned columns are appended,
-    # so we must ensure we assert in the proper order.
-    df = df.select(["calories", "sugars_g", "category", "fats_g"])
-    for streaming in [True, False]:
-        for pred in [
-            pl.col("category") == "vegetables",
-            pl.col("category") != "vegetables",
-            pl.col("fats_g") > 0.5,
-            (pl.col("fats_g") == 0.5) & (pl.col("category") == "vegetables"),
-        ]:
-            assert_frame_equal(
-                q.filter(pred)
-                .sort(sort_by)
-                .collect(engine="streaming" if streaming else "in-memory"),
-                df.filter(pred).sort(sort_by),
-            )
-
     # tests: 11536
     assert q.filter(pl.col("sugars_g") == 25).collect().shape == (1, 4)
 
@@ -74,13 +103,11 @@ def impl_test_hive_partitioned_predicate_pushdown(
 @pytest.mark.xdist_group("streaming")
 @pytest.mark.write_disk
 def test_hive_partitioned_predicate_pushdown(
-    io_files_path: Path,
-    tmp_path: Path,
+    partitioned_ipc_dataset: Path,
     monkeypatch: Any,
 ) -> None:
     impl_test_hive_partitioned_predicate_pushdown(
-        io_files_path,
-        tmp_path,
+        partitioned_ipc_dataset,
         monkeypatch,
     )
 
@@ -88,26 +115,45 @@ def test_hive_partitioned_predicate_pushdown(
 @pytest.mark.xdist_group("streaming")
 @pytest.mark.write_disk
 def test_hive_partitioned_predicate_pushdown_single_threaded_async_17155(
-    io_files_path: Path,
-    tmp_path: Path,
+    partitioned_ipc_dataset: Path,
     monkeypatch: Any,
 ) -> None:
     monkeypatch.setenv("POLARS_FORCE_ASYNC", "1")
     monkeypatch.setenv("POLARS_PREFETCH_SIZE", "1")
 
     impl_test_hive_partitioned_predicate_pushdown(
-        io_files_path,
-        tmp_path,
+        partitioned_ipc_dataset,
         monkeypatch,
     )
 
 
+@pytest.mark.xdist_group("streaming")
+@pytest.mark.write_disk
+@pytest.mark.parametrize("force_async", [False, True])
+@pytest.mark.parametrize("engine", ["streaming", "in-memory"])
+@pytest.mark.parametrize("pred_idx", range(len(_HIVE_PREDS)))
+def test_hive_partitioned_predicate_pushdown_filter(
+    hive_pushdown_cases: list[tuple[pl.LazyFrame, pl.DataFrame]],
+    monkeypatch: Any,
+    force_async: bool,
+    engine: EngineType,
+    pred_idx: int,
+) -> None:
+    if force_async:
+        # 17155
+        monkeypatch.setenv("POLARS_FORCE_ASYNC", "1")
+        monkeypatch.setenv("POLARS_PREFETCH_SIZE", "1")
+
+    q, expected = hive_pushdown_cases[pred_idx]
+
+    assert_frame_equal(q.collect(engine=engine), expected)
+
+
 @pytest.mark.write_disk
 @pytest.mark.may_fail_auto_streaming
 def test_hive_partitioned_predicate_pushdown_skips_correct_number_of_files(
-    tmp_path: Path, monkeypatch: Any, capfd: Any
+    tmp_path: Path, capfd: Any
 ) -> None:
-    monkeypatch.setenv("POLARS_VERBOSE", "1")
     df = pl.DataFrame({"d": pl.arange(0, 5, eager=True)}).with_columns(
         a=pl.col("d") % 5
     )
@@ -119,7 +165,9 @@ def test_hive_partitioned_predicate_pushdown_skips_correct_number_of_files(
     )
 
     q = pl.scan_parquet(root / "**/*.parquet", hive_partitioning=True)
-    assert q.filter(pl.col("a").is_in([1, 4])).collect().shape == (2, 2)
+    capfd.readouterr()
+    with pl.Config(verbose=True):
+        assert q.filter(pl.col("a").is_in([1, 4])).collect().shape == (2, 2)
     assert "allows skipping 3 / 5" in capfd.readouterr().err
 
     # Ensure the CSE can work with hive partitions.
@@ -160,71 +208,46 @@ def test_hive_streaming_pushdown_is_in_22212(tmp_path: Path) -> None:
 
 @pytest.mark.xdist_group("streaming")
 @pytest.mark.write_disk
-@pytest.mark.parametrize("streaming", [True, False])
+@pytest.mark.parametrize("engine", ["streaming", "in-memory"])
 def test_hive_partitioned_slice_pushdown(
-    io_files_path: Path, tmp_path: Path, streaming: bool
+    partitioned_ipc_dataset: Path, engine: EngineType
 ) -> None:
-    df = pl.read_ipc(io_files_path / "*.ipc")
-
-    root = tmp_path / "partitioned_data"
-
-    # Ignore the pyarrow legacy warning until we can write properly with new settings.
-    warnings.filterwarnings("ignore")
-    pq.write_to_dataset(
-        df.to_arrow(),
-        root_path=root,
-        partition_cols=["category", "fats_g"],
-    )
+    root = partitioned_ipc_dataset
 
     q = pl.scan_parquet(root / "**/*.parquet", hive_partitioning=True)
     schema = q.collect_schema()
     expect_count = pl.select(pl.lit(1, dtype=pl.UInt32).alias(x) for x in schema)
 
     assert_frame_equal(
-        q.head(1)
-        .collect(engine="streaming" if streaming else "in-memory")
-        .select(pl.all().len()),
-        expect_count,
+        q.head(1).collect(engine=engine).select(pl.all().len()), expect_count
     )
-    assert q.head(0).collect(
-        engine="streaming" if streaming else "in-memory"
-    ).columns == [
-        "calories",
-        "sugars_g",
-        "category",
-        "fats_g",
-    ]
+    assert schema.names() == ["calories", "sugars_g", "category", "fats_g"]
+    assert q.head(0).collect(engine=engine).schema == schema
 
 
 @pytest.mark.xdist_group("streaming")
 @pytest.mark.write_disk
+@pytest.mark.parametrize("engine", ["streaming", "in-memory"])
 def test_hive_partitioned_projection_pushdown(
-    io_files_path: Path, tmp_path: Path
+    partitioned_ipc_dataset: Path, engine: EngineType
 ) -> None:
-    df = pl.read_ipc(io_files_path / "*.ipc")
-
-    root = tmp_path / "partitioned_data"
-
-    # Ignore the pyarrow legacy warning until we can write properly with new settings.
-    warnings.filterwarnings("ignore")
-    pq.write_to_dataset(
-        df.to_arrow(),
-        root_path=root,
-        partition_cols=["category", "fats_g"],
+    q = pl.scan_parquet(
+        partitioned_ipc_dataset / "**/*.parquet", hive_partitioning=True
     )
-
-    q = pl.scan_parquet(root / "**/*.parquet", hive_partitioning=True)
     columns = ["sugars_g", "category"]
-    for streaming in [True, False]:
-        assert (
-            q.select(columns)
-            .collect(engine="streaming" if streaming else "in-memory")
-            .columns
-            == columns
-        )
+    assert q.select(columns).collect(engine=engine).columns == columns
+
+
+@pytest.mark.write_disk
+def test_hive_partitioned_projection_pushdown_hive_columns_only_11796(
+    partitioned_ipc_dataset: Path,
+) -> None:
+    root = partitioned_ipc_dataset
 
     # test that hive partition columns are projected with the correct height when
     # the projection contains only hive partition columns (11796)
+    q = pl.scan_parquet(root / "**/*.parquet", hive_partitioning=True)
+    expected = q.collect().select("category")
     for parallel in ("row_groups", "columns"):
         q = pl.scan_parquet(
             root / "**/*.parquet",
@@ -232,7 +255,6 @@ def test_hive_partitioned_projection_pushdown(
             parallel=parallel,
         )
 
-        expected = q.collect().select("category")
         result = q.select("category").collect()
 
         assert_frame_equal(result, expected)
@@ -261,12 +283,10 @@ def test_hive_partitioned_projection_skips_files(tmp_path: Path) -> None:
     assert_frame_equal(df, test_df)
 
 
-@pytest.fixture
-def dataset_path(tmp_path: Path) -> Path:
-    tmp_path.mkdir(exist_ok=True)
-
+@pytest.fixture(scope="session")
+def dataset_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
     # Set up Hive partitioned Parquet file
-    root = tmp_path / "dataset"
+    root = tmp_path_factory.mktemp("hive_ds") / "dataset"
     part1 = root / "c=1"
     part2 = root / "c=2"
     root.mkdir()
@@ -321,38 +341,62 @@ def test_read_parquet_hive_schema_with_pyarrow() -> None:
         pl.read_parquet("test.parquet", hive_schema={"c": pl.Int32}, use_pyarrow=True)
 
 
-@pytest.mark.parametrize(
-    ("scan_func", "write_func"),
-    [
+_HIVE_DIRECTORY_SCAN_DFS = [
+    pl.DataFrame({'x': 5 * [1], 'a': 1, 'b': 1}),
+    pl.DataFrame({'x': 5 * [2], 'a': 1, 'b': 2}),
+    pl.DataFrame({'x': 5 * [3], 'a': 22, 'b': 1}),
+    pl.DataFrame({'x': 5 * [4], 'a': 22, 'b': 2}),
+]  # fmt: skip
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
         (pl.scan_parquet, pl.DataFrame.write_parquet),
         (pl.scan_ipc, pl.DataFrame.write_ipc),
     ],
+    ids=["parquet", "ipc"],
 )
+def hive_directory_scan_root(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> tuple[Path, Callable[..., pl.LazyFrame]]:
+    """Hive directory tree written once per format and shared across `glob`."""
+    scan_func, write_func = request.param
+    root = tmp_path_factory.mktemp("hive_directory_scan")
+
+    if write_func is pl.DataFrame.write_parquet:
+        pl.concat(_HIVE_DIRECTORY_SCAN_DFS).lazy().sink_parquet(
+            pl.PartitionByKey(
+                root,
+                file_path=lambda ctx: ctx.hive_dirs() / "data.bin",
+                by=["a", "b"],
+                include_key=False,
+            ),
+            mkdir=True,
+        )
+    else:
+        paths = [
+            root / f"a={df.item(0, 'a')}/b={df.item(0, 'b')}/data.bin"
+            for df in _HIVE_DIRECTORY_SCAN_DFS
+        ]
+        for parent in {path.parent for path in paths}:
+            parent.mkdir(parents=True)
+        for df, path in zip(_HIVE_DIRECTORY_SCAN_DFS, paths):
+            write_func(df.drop("a", "b"), path)
+
+    return root, scan_func
+
+
 @pytest.mark.parametrize(
     "glob",
     [True, False],
 )
 def test_hive_partition_directory_scan(
-    tmp_path: Path,
-    scan_func: Callable[..., pl.LazyFrame],
-    write_func: Callable[[pl.DataFrame, Path], None],
+    hive_directory_scan_root: tuple[Path, Callable[..., pl.LazyFrame]],
     glob: bool,
 ) -> None:
-    tmp_path.mkdir(exist_ok=True)
-
-    dfs = [
-        pl.DataFrame({'x': 5 * [1], 'a': 1, 'b': 1}),
-        pl.DataFrame({'x': 5 * [2], 'a': 1, 'b': 2}),
-        pl.DataFrame({'x': 5 * [3], 'a': 22, 'b': 1}),
-        pl.DataFrame({'x': 5 * [4], 'a': 22, 'b': 2}),
-    ]  # fmt: skip
-
-    for df in dfs:
-        a = df.item(0, "a")
-        b = df.item(0, "b")
-        path = tmp_path / f"a={a}/b={b}/data.bin"
-        path.parent.mkdir(exist_ok=True, parents=True)
-        write_func(df.drop("a", "b"), path)
+    tmp_path, scan_func = hive_directory_scan_root
+    dfs = _HIVE_DIRECTORY_SCAN_DFS
 
     df = pl.concat(dfs)
     hive_schema = df.lazy().select("a", "b").collect_schema()
@@ -527,6 +571,46 @@ def test_hive_partition_force_async_17155(tmp_path: Path, monkeypatch: Any) -> N
     )
 
 
+_HIVE_COLUMNS_IN_FILE_DF = pl.DataFrame(
+    {"x": 1, "a": 1, "b": 2, "y": 1},
+    schema={"x": pl.Int32, "a": pl.Int8, "b": pl.Int16, "y": pl.Int32},
+)
+_HIVE_PARTIAL_COLUMNS_IN_FILE_DF = pl.DataFrame(
+    {"x": 1, "b": 2, "y": 1},
+    schema={"x": pl.Int32, "b": pl.Int16, "y": pl.Int32},
+)
+
+_EXPECTED_STRING_HIVE = _HIVE_COLUMNS_IN_FILE_DF.with_columns(
+    pl.col("a", "b").cast(pl.String)
+)
+_EXPECTED_PARTIAL = pl.DataFrame(
+    {"x": 1, "b": 2, "y": 1, "a": 1},
+    schema={"x": pl.Int32, "b": pl.Int16, "y": pl.Int32, "a": pl.Int64},
+)
+_EXPECTED_PARTIAL_WITH_INDEX = _EXPECTED_PARTIAL.with_row_index()
+_EXPECTED_PARTIAL_INDEX_LAST = _EXPECTED_PARTIAL_WITH_INDEX.select(
+    pl.exclude("index"), "index"
+)
+_EXPECTED_PARTIAL_STRING_HIVE = _EXPECTED_PARTIAL.with_columns(
+    pl.col("b", "a").cast(pl.String)
+)
+
+
+@pytest.fixture(scope="session")
+def hive_columns_in_file_bases(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> dict[Callable[[pl.DataFrame, Path], None], Path]:
+    """Base `a=1/b=2/data.bin` trees, written once per writer."""
+    bases = {}
+    for write_func in (pl.DataFrame.write_parquet, pl.DataFrame.write_ipc):
+        base = tmp_path_factory.mktemp("hive_columns_in_file")
+        path = base / "a=1/b=2/data.bin"
+        path.parent.mkdir(parents=True)
+        write_func(_HIVE_COLUMNS_IN_FILE_DF, path)
+        bases[write_func] = base
+    return bases
+
+
 @pytest.mark.parametrize(
     ("scan_func", "write_func"),
     [
@@ -546,18 +630,18 @@ def test_hive_partition_force_async_17155(tmp_path: Path, monkeypatch: Any) -> N
 @pytest.mark.slow
 @pytest.mark.parametrize("projection_pushdown", [True, False])
 def test_hive_partition_columns_contained_in_file(
-    tmp_path: Path,
+    hive_columns_in_file_bases: dict[Callable[[pl.DataFrame, Path], None], Path],
     scan_func: Callable[[Any], pl.LazyFrame],
     write_func: Callable[[pl.DataFrame, Path], None],
     projection_pushdown: bool,
+    tmp_path: Path,
 ) -> None:
-    path = tmp_path / "a=1/b=2/data.bin"
-    path.parent.mkdir(exist_ok=True, parents=True)
-    df = pl.DataFrame(
-        {"x": 1, "a": 1, "b": 2, "y": 1},
-        schema={"x": pl.Int32, "a": pl.Int8, "b": pl.Int16, "y": pl.Int32},
+    # Files are added to the dataset below, so work on a copy of the base tree.
+    root = Path(
+        shutil.copytree(hive_columns_in_file_bases[write_func], tmp_path / "ds")
     )
-    write_func(df, path)
+    path = root / "a=1/b=2/data.bin"
+    df = _HIVE_COLUMNS_IN_FILE_DF
 
     def assert_with_projections(
         lf: pl.LazyFrame, df: pl.DataFrame, *, row_index: str | None = None
@@ -581,61 +665,48 @@ def test_hive_partition_columns_contained_in_file(
             )
 
     lf = scan_func(path, hive_partitioning=True)  # type: ignore[call-arg]
-    rhs = df
     assert_frame_equal(
         lf.collect(
             optimizations=pl.QueryOptFlags(projection_pushdown=projection_pushdown)
         ),
-        rhs,
+        df,
     )
-    assert_with_projections(lf, rhs)
+    assert_with_projections(lf, df)
 
     lf = scan_func(  # type: ignore[call-arg]
         path,
         hive_schema={"a": pl.String, "b": pl.String},
         hive_partitioning=True,
     )
-    rhs = df.with_columns(pl.col("a", "b").cast(pl.String))
     assert_frame_equal(
         lf.collect(
             optimizations=pl.QueryOptFlags(projection_pushdown=projection_pushdown)
         ),
-        rhs,
+        _EXPECTED_STRING_HIVE,
     )
-    assert_with_projections(lf, rhs)
+    assert_with_projections(lf, _EXPECTED_STRING_HIVE)
 
     # partial cols in file
-    partial_path = tmp_path / "a=1/b=2/partial_data.bin"
-    df = pl.DataFrame(
-        {"x": 1, "b": 2, "y": 1},
-        schema={"x": pl.Int32, "b": pl.Int16, "y": pl.Int32},
-    )
-    write_func(df, partial_path)
-
-    rhs = rhs.select(
-        pl.col("x").cast(pl.Int32),
-        pl.col("b").cast(pl.Int16),
-        pl.col("y").cast(pl.Int32),
-        pl.col("a").cast(pl.Int64),
-    )
+    partial_path = root / "a=1/b=2/partial_data.bin"
+    write_func(_HIVE_PARTIAL_COLUMNS_IN_FILE_DF, partial_path)
 
     lf = scan_func(partial_path, hive_partitioning=True)  # type: ignore[call-arg]
     assert_frame_equal(
         lf.collect(
             optimizations=pl.QueryOptFlags(projection_pushdown=projection_pushdown)
         ),
-        rhs,
+        _EXPECTED_PARTIAL,
     )
-    assert_with_projections(lf, rhs)
+    assert_with_projections(lf, _EXPECTED_PARTIAL)
 
     assert_frame_equal(
         lf.with_row_index().collect(
             optimizations=pl.QueryOptFlags(projection_pushdown=projection_pushdown)
         ),
-        rhs.with_row_index(),
+        _EXPECTED_PARTIAL_WITH_INDEX,
     )
     assert_with_projections(
-        lf.with_row_index(), rhs.with_row_index(), row_index="index"
+        lf.with_row_index(), _EXPECTED_PARTIAL_WITH_INDEX, row_index="index"
     )
 
     assert_frame_equal(
@@ -644,11 +715,11 @@ def test_hive_partition_columns_contained_in_file(
         .collect(
             optimizations=pl.QueryOptFlags(projection_pushdown=projection_pushdown)
         ),
-        rhs.with_row_index().select(pl.exclude("index"), "index"),
+        _EXPECTED_PARTIAL_INDEX_LAST,
     )
     assert_with_projections(
         lf.with_row_index().select(pl.exclude("index"), "index"),
-        rhs.with_row_index().select(pl.exclude("index"), "index"),
+        _EXPECTED_PARTIAL_INDEX_LAST,
         row_index="index",
     )
 
@@ -657,23 +728,27 @@ def test_hive_partition_columns_contained_in_file(
         hive_schema={"a": pl.String, "b": pl.String},
         hive_partitioning=True,
     )
-    rhs = rhs.select(
-        pl.col("x").cast(pl.Int32),
-        pl.col("b").cast(pl.String),
-        pl.col("y").cast(pl.Int32),
-        pl.col("a").cast(pl.String),
-    )
     assert_frame_equal(
         lf.collect(
             optimizations=pl.QueryOptFlags(projection_pushdown=projection_pushdown)
         ),
-        rhs,
+        _EXPECTED_PARTIAL_STRING_HIVE,
     )
-    assert_with_projections(lf, rhs)
+    assert_with_projections(lf, _EXPECTED_PARTIAL_STRING_HIVE)
+
+
+def _unquote_hive_dirs(root: Path) -> None:
+    """Undo the percent-encoding of the hive directory names under `root`."""
+    # Deepest first, so that renaming a parent doesn't invalidate its children.
+    for path in sorted(root.glob("**/*=*"), key=lambda p: -len(p.parts)):
+        if path.is_dir():
+            path.rename(path.with_name(urllib.parse.unquote(path.name)))
 
 
 @pytest.mark.write_disk
 def test_hive_partition_dates(tmp_path: Path) -> None:
+    import pyarrow.parquet as pq
+
     df = pl.DataFrame(
         {
             "date1": [
@@ -700,17 +775,19 @@ def test_hive_partition_dates(tmp_path: Path) -> None:
         partition_cols=["date1", "date2"],
     )
 
-    lf = pl.scan_parquet(
-        root, hive_schema=df.clear().select("date1", "date2").collect_schema()
+    with_hive_schema, inferred, unparsed = pl.collect_all(
+        [
+            pl.scan_parquet(
+                root, hive_schema=df.clear().select("date1", "date2").collect_schema()
+            ),
+            pl.scan_parquet(root),
+            pl.scan_parquet(root, try_parse_hive_dates=False),
+        ]
     )
-    assert_frame_equal(lf.collect(), df.select("x", "date1", "date2"))
-
-    lf = pl.scan_parquet(root)
-    assert_frame_equal(lf.collect(), df.select("x", "date1", "date2"))
-
-    lf = pl.scan_parquet(root, try_parse_hive_dates=False)
+    assert_frame_equal(with_hive_schema, df.select("x", "date1", "date2"))
+    assert_frame_equal(inferred, df.select("x", "date1", "date2"))
     assert_frame_equal(
-        lf.collect(),
+        unparsed,
         df.select("x", "date1", "date2").with_columns(
             pl.col("date1", "date2").cast(pl.String)
         ),
@@ -718,25 +795,22 @@ def test_hive_partition_dates(tmp_path: Path) -> None:
 
     for perc_escape in [True, False] if sys.platform != "win32" else [True]:
         root = tmp_path / f"includes_hive_cols_in_file_{perc_escape}"
-        for (date1, date2), part_df in df.group_by(
-            pl.col("date1").cast(pl.String).fill_null("__HIVE_DEFAULT_PARTITION__"),
-            pl.col("date2").cast(pl.String).fill_null("__HIVE_DEFAULT_PARTITION__"),
-        ):
-            if perc_escape:
-                date2 = urllib.parse.quote(date2)  # type: ignore[call-overload]
-
-            path = root / f"date1={date1}/date2={date2}/data.bin"
-            path.parent.mkdir(exist_ok=True, parents=True)
-            part_df.write_parquet(path)
+        # The native writer percent-encodes the directory names.
+        df.write_parquet(root, partition_by=["date1", "date2"])
+        if not perc_escape:
+            _unquote_hive_dirs(root)
 
         # The schema for the hive columns is included in the file, so it should
         # just work
-        lf = pl.scan_parquet(root)
-        assert_frame_equal(lf.collect(), df)
-
-        lf = pl.scan_parquet(root, try_parse_hive_dates=False)
+        inferred, unparsed = pl.collect_all(
+            [
+                pl.scan_parquet(root),
+                pl.scan_parquet(root, try_parse_hive_dates=False),
+            ]
+        )
+        assert_frame_equal(inferred, df)
         assert_frame_equal(
-            lf.collect(),
+            unparsed,
             df.with_columns(pl.col("date1", "date2").cast(pl.String)),
         )
 
@@ -834,11 +908,14 @@ def test_hive_write(tmp_path: Path, df: pl.DataFrame) -> None:
     root = tmp_path
     df.write_parquet(root, partition_by=["a", "b"])
 
-    lf = pl.scan_parquet(root)
-    assert_frame_equal(lf.collect(), df)
-
-    lf = pl.scan_parquet(root, hive_schema={"a": pl.String, "b": pl.String})
-    assert_frame_equal(lf.collect(), df.with_columns(pl.col("a", "b").cast(pl.String)))
+    inferred, as_string = pl.collect_all(
+        [
+            pl.scan_parquet(root),
+            pl.scan_parquet(root, hive_schema={"a": pl.String, "b": pl.String}),
+        ]
+    )
+    assert_frame_equal(inferred, df)
+    assert_frame_equal(as_string, df.with_columns(pl.col("a", "b").cast(pl.String)))
 
 
 @pytest.mark.slow
@@ -856,7 +933,7 @@ def test_hive_write_multiple_files(tmp_path: Path) -> None:
     root = tmp_path
     df.write_parquet(root, partition_by="a", partition_chunk_size_bytes=chunk_size)
 
-    assert sum(1 for _ in (root / "a=0").iterdir()) == n_files
+    assert sum(1 for _ in os.scandir(root / "a=0")) == n_files
     assert_frame_equal(pl.scan_parquet(root).collect(), df)
 
 
@@ -896,14 +973,15 @@ def test_hive_write_dates(tmp_path: Path) -> None:
 
 @pytest.mark.write_disk
 @pytest.mark.may_fail_auto_streaming
-def test_hive_predicate_dates_14712(
-    tmp_path: Path, monkeypatch: Any, capfd: Any
-) -> None:
-    monkeypatch.setenv("POLARS_VERBOSE", "1")
+def test_hive_predicate_dates_14712(tmp_path: Path, capfd: Any) -> None:
     pl.DataFrame({"a": [datetime(2024, 1, 1)]}).write_parquet(
         tmp_path, partition_by="a"
     )
-    pl.scan_parquet(tmp_path).filter(pl.col("a") != datetime(2024, 1, 1)).collect()
+    capfd.readouterr()
+    with pl.Config(verbose=True):
+        pl.scan_parquet(tmp_path).filter(
+            pl.col("a") != datetime(2024, 1, 1)
+        ).collect()
     assert "allows skipping 1 / 1" in capfd.readouterr().err
 
 
@@ -965,94 +1043,106 @@ def test_passing_hive_schema_with_hive_partitioning_disabled_raises(
         ).collect()
 
 
-@pytest.mark.write_disk
-def test_hive_auto_enables_when_unspecified_and_hive_schema_passed(
-    tmp_path: Path,
-) -> None:
-    tmp_path.mkdir(exist_ok=True)
-    (tmp_path / "a=1").mkdir(exist_ok=True)
+_EXPECTED_X1_A1_U8 = pl.DataFrame(
+    [
+        pl.Series("x", [1]),
+        pl.Series("a", [1], dtype=pl.UInt8),
+    ]
+)
 
-    pl.DataFrame({"x": 1}).write_parquet(tmp_path / "a=1/1")
 
-    for path in [tmp_path / "a=1/1", tmp_path / "**/*"]:
-        lf = pl.scan_parquet(path, hive_schema={"a": pl.UInt8})
+@pytest.fixture(scope="session")
+def x1_parquet_bytes() -> bytes:
+    """Encoded parquet file of `pl.DataFrame({"x": 1})`."""
+    buf = io.BytesIO()
+    pl.DataFrame({"x": 1}).write_parquet(buf)
+    return buf.getvalue()
 
-        assert_frame_equal(
-            lf.collect(),
-            pl.select(
-                pl.Series("x", [1]),
-                pl.Series("a", [1], dtype=pl.UInt8),
-            ),
-        )
+
+@pytest.fixture(scope="session")
+def x1_hive_root(
+    tmp_path_factory: pytest.TempPathFactory, x1_parquet_bytes: bytes
+) -> Path:
+    """Read-only root holding the `x1_parquet_bytes` file at `a=1/1`."""
+    root = tmp_path_factory.mktemp("hive_x1")
+    (root / "a=1").mkdir()
+
+    (root / "a=1/1").write_bytes(x1_parquet_bytes)
+
+    return root
 
 
 @pytest.mark.write_disk
-def test_hive_file_as_uri_with_hive_start_idx_23830(
-    tmp_path: Path,
+@pytest.mark.parametrize("relpath", ["a=1/1", "**/*"])
+def test_hive_auto_enables_when_unspecified_and_hive_schema_passed(
+    x1_hive_root: Path, relpath: str
 ) -> None:
-    tmp_path.mkdir(exist_ok=True)
-    (tmp_path / "a=1").mkdir(exist_ok=True)
+    lf = pl.scan_parquet(x1_hive_root / relpath, hive_schema={"a": pl.UInt8})
+
+    assert_frame_equal(lf.collect(), _EXPECTED_X1_A1_U8)
 
-    pl.DataFrame({"x": 1}).write_parquet(tmp_path / "a=1/1")
 
+@pytest.mark.write_disk
+def test_hive_file_as_uri_with_hive_start_idx_23830(x1_hive_root: Path) -> None:
     # ensure we have a trailing "/"
-    uri = tmp_path.resolve().as_posix().rstrip("/") + "/"
+    uri = x1_hive_root.resolve().as_posix().rstrip("/") + "/"
     uri = "file://" + uri
 
     lf = pl.scan_parquet(uri, hive_schema={"a": pl.UInt8})
 
-    assert_frame_equal(
-        lf.collect(),
-        pl.select(
-            pl.Series("x", [1]),
-            pl.Series("a", [1], dtype=pl.UInt8),
-        ),
-    )
+    assert_frame_equal(lf.collect(), _EXPECTED_X1_A1_U8)
 
 
-@pytest.mark.write_disk
-@pytest.mark.parametrize("force_single_thread", [True, False])
-def test_hive_parquet_prefiltered_20894_21327(
-    tmp_path: Path, force_single_thread: bool
-) -> None:
-    n_threads = 1 if force_single_thread else pl.thread_pool_size()
-
-    file_path = tmp_path / "date=2025-01-01/00000000.parquet"
-    file_path.parent.mkdir(exist_ok=True, parents=True)
+@pytest.fixture(scope="session")
+def prefilter_dataset(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    file_path = (
+        tmp_path_factory.mktemp("hive_prefilter") / "date=2025-01-01/00000000.parquet"
+    )
+    file_path.parent.mkdir()
 
-    data = pl.DataFrame(
+    pl.DataFrame(
         {
             "date": [date(2025, 1, 1), date(2025, 1, 1)],
             "value": ["1", "2"],
         }
-    )
+    ).write_parquet(file_path)
 
-    data.write_parquet(file_path)
+    return file_path
 
-    import base64
-    import subprocess
 
-    # For security, and for Windows backslashes.
-    scan_path_b64 = base64.b64encode(str(file_path.absolute()).encode()).decode()
+@pytest.mark.write_disk
+@pytest.mark.parametrize("force_single_thread", [True, False])
+def test_hive_parquet_prefiltered_20894_21327(
+    prefilter_dataset: Path, force_single_thread: bool
+) -> None:
+    n_threads = 1 if force_single_thread else pl.thread_pool_size()
+    file_path = prefilter_dataset
+
+    import json
+    import subprocess
 
     # This is, the easiest way to control the threadpool size so that it is stable.
+    # The path is passed over stdin as JSON, which is safe for Windows backslashes.
     out = subprocess.check_output(
         [
             sys.executable,
             "-c",
-            f"""\
+            """\
+import json
 import os
-os.environ["POLARS_MAX_THREADS"] = "{n_threads}"
+import sys
+
+payload = json.loads(sys.stdin.read())
+os.environ["POLARS_MAX_THREADS"] = str(payload["n_threads"])
 
 import polars as pl
 import datetime
-import base64
 
 from polars.testing import assert_frame_equal
 
-assert pl.thread_pool_size() == {n_threads}
+assert pl.thread_pool_size() == payload["n_threads"]
 
-tmp_path = base64.b64decode("{scan_path_b64}").decode()
+tmp_path = payload["path"]
 df = pl.scan_parquet(tmp_path, hive_partitioning=True).filter(pl.col("value") == "1").collect()
 # We need the str() to trigger panic on invalid state
 str(df)
@@ -1067,6 +1157,9 @@ assert_frame_equal(df, pl.DataFrame(
 print("OK", end="")
 """,
         ],
+        input=json.dumps(
+            {"path": str(file_path.absolute()), "n_threads": n_threads}
+        ).encode(),
     )
 
     assert out == b"OK"
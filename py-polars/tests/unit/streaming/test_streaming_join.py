@@ -13,93 +13,85 @@ from polars.testing import assert_frame_equal, assert_series_equal
 if TYPE_CHECKING:
     from pathlib import Path
 
-    from polars._typing import JoinStrategy
+    from polars._typing import EngineType, JoinStrategy
 
 pytestmark = pytest.mark.xdist_group("streaming")
 
 
-def test_streaming_full_outer_joins() -> None:
+@pytest.fixture(scope="module")
+def random_join_frames() -> tuple[pd.DataFrame, pd.DataFrame]:
+    rng = np.random.default_rng(seed=0)
     n = 100
-    dfa = pl.DataFrame(
-        {
-            "a": np.random.randint(0, 40, n),
-            "idx": np.arange(0, n),
-        }
-    )
+    dfa = pd.DataFrame({"a": rng.integers(0, 40, n), "b": np.arange(0, n)})
+    dfb = pd.DataFrame({"a": rng.integers(0, 40, n), "b": np.arange(0, n)})
+    return dfa, dfb
 
-    n = 100
-    dfb = pl.DataFrame(
-        {
-            "a": np.random.randint(0, 40, n),
-            "idx": np.arange(0, n),
-        }
+
+@pytest.fixture(scope="module")
+def full_outer_join_frames(
+    random_join_frames: tuple[pd.DataFrame, pd.DataFrame],
+) -> tuple[pl.LazyFrame, pl.LazyFrame]:
+    dfa, dfb = (
+        pl.from_pandas(df).rename({"b": "idx"}).lazy() for df in random_join_frames
     )
+    return dfa, dfb
 
-    join_strategies: list[tuple[JoinStrategy, bool]] = [
+
+@pytest.mark.parametrize(
+    ("how", "coalesce"),
+    [
         ("full", False),
         ("full", True),
-    ]
-    for how, coalesce in join_strategies:
-        q = (
-            dfa.lazy()
-            .join(dfb.lazy(), on="a", how=how, coalesce=coalesce)
-            .sort(["idx"])
-        )
-        a = q.collect(engine="streaming")
-        b = q.collect(engine="in-memory")
-        assert_frame_equal(a, b, check_row_order=False)
-
-
-def test_streaming_joins() -> None:
-    n = 100
-    dfa = pd.DataFrame(
-        {
-            "a": np.random.randint(0, 40, n),
-            "b": np.arange(0, n),
-        }
+    ],
+)
+def test_streaming_full_outer_joins(
+    how: JoinStrategy,
+    coalesce: bool,
+    full_outer_join_frames: tuple[pl.LazyFrame, pl.LazyFrame],
+) -> None:
+    dfa, dfb = full_outer_join_frames
+    q = dfa.join(dfb, on="a", how=how, coalesce=coalesce).sort(["idx"])
+    a = q.collect(engine="streaming")
+    b = q.collect(engine="in-memory")
+    assert_frame_equal(a, b, check_row_order=False)
+
+
+@pytest.fixture(scope="module")
+def streaming_join_frames(
+    random_join_frames: tuple[pd.DataFrame, pd.DataFrame],
+) -> tuple[pl.LazyFrame, pl.LazyFrame]:
+    dfa, dfb = random_join_frames
+    return pl.from_pandas(dfa).sort("a").lazy(), pl.from_pandas(dfb).lazy()
+
+
+@pytest.mark.parametrize("how", ["inner", "left"])
+@pytest.mark.parametrize(
+    ("on", "sort_by"),
+    [
+        ("a", ["a", "b", "b_right"]),
+        (["a", "b"], ["a", "b"]),
+    ],
+)
+def test_streaming_joins(
+    how: Literal["inner", "left"],
+    on: str | list[str],
+    sort_by: list[str],
+    random_join_frames: tuple[pd.DataFrame, pd.DataFrame],
+    streaming_join_frames: tuple[pl.LazyFrame, pl.LazyFrame],
+) -> None:
+    dfa, dfb = random_join_frames
+    dfa_pl, dfb_pl = streaming_join_frames
+
+    pd_result = dfa.merge(dfb, on=on, how=how)
+    pd_result.columns = pd.Index(sort_by)
+
+    pl_result = (
+        dfa_pl.join(dfb_pl, on=on, how=how).sort(sort_by).collect(engine="streaming")
     )
 
-    n = 100
-    dfb = pd.DataFrame(
-        {
-            "a": np.random.randint(0, 40, n),
-            "b": np.arange(0, n),
-        }
-    )
-    dfa_pl = pl.from_pandas(dfa).sort("a")
-    dfb_pl = pl.from_pandas(dfb)
-
-    join_strategies: list[Literal["inner", "left"]] = ["inner", "left"]
-    for how in join_strategies:
-        pd_result = dfa.merge(dfb, on="a", how=how)
-        pd_result.columns = pd.Index(["a", "b", "b_right"])
-
-        pl_result = (
-            dfa_pl.lazy()
-            .join(dfb_pl.lazy(), on="a", how=how)
-            .sort(["a", "b", "b_right"])
-            .collect(engine="streaming")
-        )
-
-        a = (
-            pl.from_pandas(pd_result)
-            .with_columns(pl.all().cast(int))
-            .sort(["a", "b", "b_right"])
-        )
-        assert_frame_equal(a, pl_result, check_dtypes=False)
-
-        pd_result = dfa.merge(dfb, on=["a", "b"], how=how)
-
-        pl_result = (
-            dfa_pl.lazy()
-            .join(dfb_pl.lazy(), on=["a", "b"], how=how)
-            .sort(["a", "b"])
-            .collect(engine="streaming")
-        )
-
-        # we cast to integer because pandas joins creates floats
-        a = pl.from_pandas(pd_result).with_columns(pl.all().cast(int)).sort(["a", "b"])
-        assert_frame_equal(a, pl_result, check_dtypes=False)
+    # we cast to integer because pandas joins creates floats
+    a = pl.from_pandas(pd_result).with_columns(pl.all().cast(int)).sort(sort_by)
+    assert_frame_equal(a, pl_result, check_dtypes=False)
 
 
 def test_streaming_cross_join_empty() -> None:
@@ -128,9 +120,8 @@ def test_streaming_join_rechunk_12498() -> None:
     }
 
 
-@pytest.mark.parametrize("maintain_order", [False, True])
-def test_join_null_matches(maintain_order: bool) -> None:
-    # null values in joins should never find a match.
+@pytest.fixture(scope="module")
+def null_match_frames() -> tuple[pl.LazyFrame, pl.LazyFrame]:
     df_a = pl.LazyFrame(
         {
             "idx_a": [0, 1, 2],
@@ -144,6 +135,15 @@ def test_join_null_matches(maintain_order: bool) -> None:
             "a": [None, 2, 1, None],
         }
     )
+    return df_a, df_b
+
+
+@pytest.mark.parametrize("maintain_order", [False, True])
+def test_join_null_matches(
+    maintain_order: bool, null_match_frames: tuple[pl.LazyFrame, pl.LazyFrame]
+) -> None:
+    # null values in joins should never find a match.
+    df_a, df_b = null_match_frames
     # Semi
     assert_series_equal(
         df_a.join(
@@ -216,8 +216,8 @@ def test_join_null_matches(maintain_order: bool) -> None:
     )
 
 
-@pytest.mark.parametrize("streaming", [False, True])
-def test_join_null_matches_multiple_keys(streaming: bool) -> None:
+@pytest.fixture(scope="module")
+def null_match_multiple_keys_frames() -> tuple[pl.LazyFrame, pl.LazyFrame]:
     df_a = pl.LazyFrame(
         {
             "a": [None, 1, 2],
@@ -232,6 +232,15 @@ def test_join_null_matches_multiple_keys(streaming: bool) -> None:
             "c": [10, 20, 30, 40, 50],
         }
     )
+    return df_a, df_b
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_join_null_matches_multiple_keys(
+    streaming: bool,
+    null_match_multiple_keys_frames: tuple[pl.LazyFrame, pl.LazyFrame],
+) -> None:
+    df_a, df_b = null_match_multiple_keys_frames
 
     expected = pl.DataFrame({"a": [1], "idx": [1], "c": [50]})
     assert_frame_equal(
@@ -268,7 +277,8 @@ def test_join_null_matches_multiple_keys(streaming: bool) -> None:
     )
 
 
-def test_streaming_join_and_union() -> None:
+@pytest.fixture(scope="module")
+def join_and_union_query() -> pl.LazyFrame:
     a = pl.LazyFrame({"a": [1, 2]})
 
     b = pl.LazyFrame({"a": [1, 2, 4, 8]})
@@ -276,10 +286,14 @@ def test_streaming_join_and_union() -> None:
     c = a.join(b, on="a", maintain_order="left_right")
     # The join node latest ensures that the dispatcher
     # needs to replace placeholders in unions.
-    q = pl.concat([a, b, c])
+    return pl.concat([a, b, c])
 
-    out = q.collect(engine="streaming")
-    assert_frame_equal(out, q.collect(engine="in-memory"))
+
+@pytest.mark.parametrize("engine", ["streaming", "in-memory"])
+def test_streaming_join_and_union(
+    engine: EngineType, join_and_union_query: pl.LazyFrame
+) -> None:
+    out = join_and_union_query.collect(engine=engine)
     assert out.to_series().to_list() == [1, 2, 1, 2, 4, 8, 1, 2]
 
 
@@ -303,18 +317,32 @@ def test_non_coalescing_streaming_left_join() -> None:
     )
 
 
-@pytest.mark.write_disk
-def test_streaming_outer_join_partial_flush(tmp_path: Path) -> None:
-    data = {
-        "value_at": [datetime(2024, i + 1, 1) for i in range(6)],
-        "value": list(range(6)),
-    }
+@pytest.fixture(scope="session")
+def outer_join_parquet_paths(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[Path, Path]:
+    tmp_path = tmp_path_factory.mktemp("outer_join_partial_flush")
+    df = pl.DataFrame(
+        {
+            "value_at": [datetime(2024, i + 1, 1) for i in range(6)],
+            "value": list(range(6)),
+        }
+    )
 
+    # Two separate files, so the two scans are not merged into one
     parquet_path = tmp_path / "data.parquet"
-    pl.DataFrame(data=data).write_parquet(parquet_path)
+    df.write_parquet(parquet_path)
 
     other_parquet_path = tmp_path / "data2.parquet"
-    pl.DataFrame(data=data).write_parquet(other_parquet_path)
+    df.write_parquet(other_parquet_path)
+    return parquet_path, other_parquet_path
+
+
+@pytest.mark.write_disk
+def test_streaming_outer_join_partial_flush(
+    outer_join_parquet_paths: tuple[Path, Path],
+) -> None:
+    parquet_path, other_parquet_path = outer_join_parquet_paths
 
     lf1 = pl.scan_parquet(other_parquet_path)
     lf2 = pl.scan_parquet(parquet_path)
@@ -184,6 +184,16 @@ def test_update_existing_key() -> None:
     assert cache[1] == 10.5
 
 
+def test_update_existing_key_full_cache() -> None:
+    cache = LRUCache[str, int](maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+
+    # overwriting an existing key must not evict anything
+    cache["a"] = 10
+    assert list(cache.items()) == [("b", 2), ("a", 10)]
+
+
 def test_update_existing_keys() -> None:
     cache = LRUCache[str, float](maxsize=3)
     cache["pi"] = 3.14